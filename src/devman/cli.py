@@ -4,16 +4,19 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from .config import ProjectConfig
-from .templater import DevEnvTemplater
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from .templater import DevEnvTemplater
 
 console = Console()
 app = typer.Typer(
@@ -23,19 +26,83 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+_PROJECT_TYPES = ("api", "web", "cli", "ml", "lib")
+_CONTAINER_TYPES = ("devenv", "docker", "nixos", "none")
+_VALID_PROJECT_TYPES = frozenset(_PROJECT_TYPES)
+_VALID_CONTAINERS = frozenset(_CONTAINER_TYPES)
+_VALID_PROJECT_TYPES_STR = ", ".join(_PROJECT_TYPES)
+_VALID_CONTAINERS_STR = ", ".join(_CONTAINER_TYPES)
+
+# Option specs shared by several commands
+_PROJECT_TYPE_OPTION = typer.Option("--type", "-t", help="Project type")
+_PYTHON_VERSION_OPTION = typer.Option("--python", "-p", help="Python version")
+_CONTAINER_TYPE_OPTION = typer.Option("--containers", "-c", help="Container type")
+_FORCE_OPTION = typer.Option("--force", "-f", help="Overwrite existing files")
+_NO_FORMAT_OPTION = typer.Option("--no-format", help="Disable rich formatting")
+
+_TEMPLATES = (
+    ("api", "FastAPI REST API", "FastAPI, uvicorn, async"),
+    ("web", "Flask web application", "Flask, templates, static files"),
+    ("cli", "Command line interface", "Click/Typer, entry points"),
+    ("ml", "Machine learning project", "scikit-learn, jupyter, data tools"),
+    ("lib", "Python library", "Publishing ready, minimal deps"),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_templater() -> DevEnvTemplater:
+    """Get the shared templater so its Jinja2 environment is reused."""
+    from .templater import DevEnvTemplater
+
+    return DevEnvTemplater()
+
+
+@lru_cache(maxsize=1)
+def _templates_table() -> Table:
+    """Build the static table of available project templates once."""
+    from rich.table import Table
+
+    table = Table(title="📋 Available Templates")
+    table.add_column("Type", style="cyan")
+    table.add_column("Description", style="white")
+    table.add_column("Features", style="dim")
+
+    for template_type, desc, features in _TEMPLATES:
+        table.add_row(template_type, desc, features)
+
+    return table
+
+
+def _get_console(no_format: bool) -> Console:
+    """Get the console to print with, without colors if formatting is off."""
+    return Console(no_color=True) if no_format else console
+
+
+@contextmanager
+def _status(out: Console, message: str) -> Iterator[None]:
+    """Show a spinner while work runs, skipping it when not on a terminal."""
+    if out.is_terminal:
+        with out.status(message):
+            yield
+    else:
+        yield
+
+
+def _is_nonempty(path: Path) -> bool:
+    """Check whether a directory has at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except FileNotFoundError:
+        return False
+
 
 @app.command(no_args_is_help=True)
 def new(
     name: Annotated[str, typer.Argument(help="Project name")],
-    project_type: Annotated[
-        str, typer.Option("--type", "-t", help="Project type")
-    ] = "api",
-    python_version: Annotated[
-        str, typer.Option("--python", "-p", help="Python version")
-    ] = "3.11",
-    container_type: Annotated[
-        Optional[str], typer.Option("--containers", "-c", help="Container type")
-    ] = "devenv",
+    project_type: Annotated[str, _PROJECT_TYPE_OPTION] = "api",
+    python_version: Annotated[str, _PYTHON_VERSION_OPTION] = "3.11",
+    container_type: Annotated[Optional[str], _CONTAINER_TYPE_OPTION] = "devenv",
     database: Annotated[
         Optional[str], typer.Option("--database", "-d", help="Database type")
     ] = None,
@@ -52,40 +119,37 @@ def new(
     directory: Annotated[
         Optional[str], typer.Option("--dir", "-D", help="Target directory")
     ] = None,
-    force: Annotated[
-        bool, typer.Option("--force", "-f", help="Overwrite existing files")
-    ] = False,
-    no_format: Annotated[
-        bool, typer.Option("--no-format", help="Disable rich formatting")
-    ] = False,
+    force: Annotated[bool, _FORCE_OPTION] = False,
+    no_format: Annotated[bool, _NO_FORMAT_OPTION] = False,
 ) -> None:
     """Create a new devenv project from templates."""
-    if no_format:
-        os.environ["NO_COLOR"] = "1"
+    from rich.panel import Panel
+
+    from .config import ProjectConfig
+
+    out = _get_console(no_format)
 
     target_dir = Path(directory) if directory else Path(name)
 
-    if target_dir.exists() and any(target_dir.iterdir()) and not force:
-        console.print(
+    if _is_nonempty(target_dir) and not force:
+        out.print(
             f"❌ Directory {target_dir} already exists and is not empty. Use --force to overwrite.",
             style="red",
         )
         raise typer.Exit(1)
 
     # Validate project type
-    valid_types = ["api", "web", "cli", "ml", "lib"]
-    if project_type not in valid_types:
-        console.print(
-            f"❌ Invalid project type. Choose from: {', '.join(valid_types)}",
+    if project_type not in _VALID_PROJECT_TYPES:
+        out.print(
+            f"❌ Invalid project type. Choose from: {_VALID_PROJECT_TYPES_STR}",
             style="red",
         )
         raise typer.Exit(1)
 
     # Validate container type
-    valid_containers = ["devenv", "docker", "nixos", "none"]
-    if container_type and container_type not in valid_containers:
-        console.print(
-            f"❌ Invalid container type. Choose from: {', '.join(valid_containers)}",
+    if container_type and container_type not in _VALID_CONTAINERS:
+        out.print(
+            f"❌ Invalid container type. Choose from: {_VALID_CONTAINERS_STR}",
             style="red",
         )
         raise typer.Exit(1)
@@ -103,16 +167,16 @@ def new(
             database_type=database or "postgresql",
         )
     except Exception as e:
-        console.print(f"❌ Configuration error: {e}", style="red")
+        out.print(f"❌ Configuration error: {e}", style="red")
         raise typer.Exit(1)
 
-    templater = DevEnvTemplater()
+    templater = _get_templater()
 
-    with console.status(f"[bold blue]Creating project {name}..."):
+    with _status(out, f"[bold blue]Creating project {name}..."):
         templater.generate_project(config, target_dir)
 
     # Success output
-    console.print(
+    out.print(
         Panel.fit(
             f"[bold green]✅ Project '{name}' created successfully![/bold green]\n\n"
             f"[bold]Next steps:[/bold]\n"
@@ -129,30 +193,22 @@ def new(
 @app.command(no_args_is_help=True)
 def update(
     name: Annotated[str, typer.Argument(help="Project name")],
-    project_type: Annotated[
-        Optional[str], typer.Option("--type", "-t", help="Project type")
-    ] = None,
-    python_version: Annotated[
-        Optional[str], typer.Option("--python", "-p", help="Python version")
-    ] = None,
-    container_type: Annotated[
-        Optional[str], typer.Option("--containers", "-c", help="Container type")
-    ] = None,
-    force: Annotated[
-        bool, typer.Option("--force", "-f", help="Overwrite existing files")
-    ] = False,
-    no_format: Annotated[
-        bool, typer.Option("--no-format", help="Disable rich formatting")
-    ] = False,
+    project_type: Annotated[Optional[str], _PROJECT_TYPE_OPTION] = None,
+    python_version: Annotated[Optional[str], _PYTHON_VERSION_OPTION] = None,
+    container_type: Annotated[Optional[str], _CONTAINER_TYPE_OPTION] = None,
+    force: Annotated[bool, _FORCE_OPTION] = False,
+    no_format: Annotated[bool, _NO_FORMAT_OPTION] = False,
 ) -> None:
     """Update existing project files from templates."""
+    from .config import ProjectConfig
+
+    out = _get_console(no_format)
 
-    if no_format:
-        os.environ["NO_COLOR"] = "1"
+    cwd = Path.cwd()
 
     # if not Path("pyproject.toml").exists():
-    if not (Path.cwd() / "pyproject.toml").exists():
-        console.print(
+    if not (cwd / "pyproject.toml").exists():
+        out.print(
             "❌ No pyproject.toml found. Are you in a project directory?", style="red"
         )
         raise typer.Exit(1)
@@ -167,51 +223,37 @@ def update(
             container_type=container_type or "none",
         )
     except Exception as e:
-        console.print(f"❌ Configuration error: {e}", style="red")
+        out.print(f"❌ Configuration error: {e}", style="red")
         raise typer.Exit(1)
 
-    templater = DevEnvTemplater()
+    templater = _get_templater()
 
     if not force:
-        console.print(
+        out.print(
             "⚠️ This will overwrite configuration files. Continue?", style="yellow"
         )
         if not typer.confirm(""):
-            console.print("❌ Update cancelled.")
+            out.print("❌ Update cancelled.")
             raise typer.Exit(0)
 
-    with console.status("[bold blue]Updating project files..."):
-        templater.generate_project(config, Path("."))
+    with _status(out, "[bold blue]Updating project files..."):
+        templater.generate_project(config, cwd)
 
-    console.print("✅ Project files updated!", style="green")
+    out.print("✅ Project files updated!", style="green")
 
 
 @app.command()
 def list_templates() -> None:
     """List available project templates."""
-    table = Table(title="📋 Available Templates")
-    table.add_column("Type", style="cyan")
-    table.add_column("Description", style="white")
-    table.add_column("Features", style="dim")
-
-    templates = [
-        ("api", "FastAPI REST API", "FastAPI, uvicorn, async"),
-        ("web", "Flask web application", "Flask, templates, static files"),
-        ("cli", "Command line interface", "Click/Typer, entry points"),
-        ("ml", "Machine learning project", "scikit-learn, jupyter, data tools"),
-        ("lib", "Python library", "Publishing ready, minimal deps"),
-    ]
-
-    for template_type, desc, features in templates:
-        table.add_row(template_type, desc, features)
-
-    console.print(table)
+    console.print(_templates_table())
 
 
 @app.command()
 def config() -> None:
     """Show current configuration and status."""
-    templater = DevEnvTemplater()
+    from rich.table import Table
+
+    templater = _get_templater()
 
     table = Table(title="⚙️ Configuration")
     table.add_column("Setting", style="cyan")
@@ -237,25 +279,22 @@ def init_templates(
     force: Annotated[
         bool, typer.Option("--force", "-f", help="Overwrite existing templates")
     ] = False,
-    no_format: Annotated[
-        bool, typer.Option("--no-format", help="Disable rich formatting")
-    ] = False,
+    no_format: Annotated[bool, _NO_FORMAT_OPTION] = False,
 ) -> None:
     """Initialize or update template files."""
-    if no_format:
-        os.environ["NO_COLOR"] = "1"
+    out = _get_console(no_format)
 
-    templater = DevEnvTemplater()
+    templater = _get_templater()
 
     if templater.templates_dir.exists() and not force:
-        console.print(f"Templates already exist at {templater.templates_dir}")
+        out.print(f"Templates already exist at {templater.templates_dir}")
         if not typer.confirm("Overwrite existing templates?"):
             raise typer.Exit(0)
 
-    with console.status("[bold blue]Creating template files..."):
+    with _status(out, "[bold blue]Creating template files..."):
         templater.ensure_templates_exist()
 
-    console.print(
+    out.print(
         f"✅ Templates initialized at {templater.templates_dir}", style="green"
     )
 '''
@@ -3,14 +3,53 @@
 
 from __future__ import annotations
 
-from typing import Literal
-
-from pydantic import BaseModel, Field, computed_field
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Literal, Self
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+# Runtime dependencies by project type
+_RUNTIME_DEPS: dict[str, tuple[str, ...]] = {
+    "api": ("fastapi>=0.104.0", "uvicorn[standard]>=0.24.0"),
+    "web": ("flask>=3.0.0", "jinja2>=3.1.0"),
+    "cli": ("typer[all]>=0.12.0", "rich>=13.0.0"),
+    "ml": (
+        "numpy>=1.24.0",
+        "pandas>=2.0.0",
+        "scikit-learn>=1.3.0",
+        "matplotlib>=3.7.0",
+    ),
+}
+
+# Development dependencies shared by all project types
+_BASE_DEV_DEPS: tuple[str, ...] = (
+    "pytest>=7.4.0",
+    "pytest-cov>=4.1.0",
+    "ruff>=0.1.0",
+    "mypy>=1.7.0",
+)
+
+# Additional development dependencies by project type
+_DEV_DEPS: dict[str, tuple[str, ...]] = {
+    "api": ("httpx>=0.25.0", "pytest-asyncio>=0.21.0"),
+    "web": ("pytest-flask>=1.3.0",),
+    "ml": ("jupyter>=1.0.0", "ipykernel>=6.25.0"),
+}
+
+# cached_property values live in the instance __dict__, which model_copy copies
+_CACHED_PROPERTIES = (
+    "default_dependencies",
+    "default_dev_dependencies",
+    "_scalar_context",
+)
 
 
 class ProjectConfig(BaseModel):
     """Configuration for a devenv project."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Project name")
     python_version: str = Field(default="3.11", description="Python version")
     project_type: Literal["api", "web", "cli", "ml", "lib"] = Field(
@@ -33,6 +72,15 @@ class ProjectConfig(BaseModel):
     use_redis: bool = Field(default=False, description="Enable Redis integration")
     use_celery: bool = Field(default=False, description="Enable Celery integration")
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the config, dropping cached values derived from old fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _CACHED_PROPERTIES:
+            copied.__dict__.pop(name, None)
+        return copied
+
     @computed_field
     @property
     def use_containers(self) -> bool:
@@ -45,23 +93,10 @@ class ProjectConfig(BaseModel):
         """Python version without dots (e.g., '311')."""
         return self.python_version.replace(".", "")
 
-    def get_default_dependencies(self) -> list[str]:
-        """Get default dependencies for project type."""
-        deps: list[str] = []
-
-        if self.project_type == "api":
-            deps.extend(["fastapi>=0.104.0", "uvicorn[standard]>=0.24.0"])
-        elif self.project_type == "web":
-            deps.extend(["flask>=3.0.0", "jinja2>=3.1.0"])
-        elif self.project_type == "cli":
-            deps.extend(["typer[all]>=0.12.0", "rich>=13.0.0"])
-        elif self.project_type == "ml":
-            deps.extend([
-                "numpy>=1.24.0",
-                "pandas>=2.0.0",
-                "scikit-learn>=1.3.0",
-                "matplotlib>=3.7.0",
-            ])
+    @cached_property
+    def default_dependencies(self) -> tuple[str, ...]:
+        """Default dependencies for project type, computed once per config."""
+        deps = list(_RUNTIME_DEPS.get(self.project_type, ()))
 
         if self.use_database:
             if self.database_type == "postgresql":
@@ -74,31 +109,24 @@ class ProjectConfig(BaseModel):
         if self.use_celery:
             deps.extend(["celery>=5.3.0", "redis>=5.0.0"])
 
-        return deps
+        return tuple(deps)
 
-    def get_default_dev_dependencies(self) -> list[str]:
-        """Get default dev dependencies for project type."""
-        deps = [
-            "pytest>=7.4.0",
-            "pytest-cov>=4.1.0",
-            "ruff>=0.1.0",
-            "mypy>=1.7.0",
-        ]
+    @cached_property
+    def default_dev_dependencies(self) -> tuple[str, ...]:
+        """Default dev dependencies for project type, computed once per config."""
+        return _BASE_DEV_DEPS + _DEV_DEPS.get(self.project_type, ())
 
-        if self.project_type == "api":
-            deps.extend(["httpx>=0.25.0", "pytest-asyncio>=0.21.0"])
-        elif self.project_type == "web":
-            deps.append("pytest-flask>=1.3.0")
-        elif self.project_type == "ml":
-            deps.extend(["jupyter>=1.0.0", "ipykernel>=6.25.0"])
-
-        return deps
+    def get_default_dependencies(self) -> list[str]:
+        """Get default dependencies for project type."""
+        return list(self.default_dependencies)
 
-    def get_template_context(self) -> dict[str, object]:
-        """Get template context dictionary for Jinja2 rendering."""
-        all_deps = self.get_default_dependencies() + self.dependencies
-        all_dev_deps = self.get_default_dev_dependencies() + self.dev_dependencies
+    def get_default_dev_dependencies(self) -> list[str]:
+        """Get default dev dependencies for project type."""
+        return list(self.default_dev_dependencies)
 
+    @cached_property
+    def _scalar_context(self) -> dict[str, object]:
+        """Template context entries from the frozen scalar fields, built once."""
         return {
             "name": self.name,
             "python_version": self.python_version,
@@ -110,7 +138,17 @@ class ProjectConfig(BaseModel):
             "database_type": self.database_type,
             "use_redis": self.use_redis,
             "use_celery": self.use_celery,
-            "dependencies": all_deps,
-            "dev_dependencies": all_dev_deps,
-            "local_dependencies": self.local_dependencies,
         }
+
+    def get_template_context(self) -> dict[str, object]:
+        """Get template context dictionary for Jinja2 rendering."""
+        context = dict(self._scalar_context)
+
+        # List fields can still be mutated in place, so build these per call
+        context["dependencies"] = [*self.default_dependencies, *self.dependencies]
+        context["dev_dependencies"] = [
+            *self.default_dev_dependencies,
+            *self.dev_dependencies,
+        ]
+        context["local_dependencies"] = list(self.local_dependencies)
+        return context
@@ -5,86 +5,66 @@ from __future__ import annotations
 
 import os
 import subprocess
+from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, ConfigDict, SkipValidation, field_validator
+from jinja2 import TemplateError
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
 
 from .config import ProjectConfig
-from .templates import TEMPLATE_REGISTRY, TemplateRegistry
+from .templates import DEFAULT_TEMPLATES_DIR, TEMPLATE_REGISTRY, TemplateRegistry
 
 
-if os.getenv("PYTEST_CURRENT_TEST"):  # pytest sets this
-    RegistryLike = TemplateRegistry | SkipValidation[TemplateRegistry]
-else:
-    RegistryLike = TemplateRegistry
+# Mock registries are only accepted when the test suite opts in; the validator
+# that allows them is not installed at all otherwise
+_ALLOW_MOCK_REGISTRY = os.environ.get("DEVMAN_ALLOW_MOCK_REGISTRY") == "1"
 
 
-class ProjectStructure(BaseModel):
-    """Manages project directory structure creation."""
-
-    target_path: Path = Field(..., description="Target project path")
-    config: ProjectConfig = Field(..., description="Project configuration")
-
-    def create_directories(self) -> None:
-        """Create project directory structure."""
-        # Main source directory
-        (self.target_path / "src" / self.config.name).mkdir(parents=True, exist_ok=True)
-
-        # Tests directory
-        (self.target_path / "tests").mkdir(exist_ok=True)
-
-        # Create __init__.py files
-        (self.target_path / "src" / self.config.name / "__init__.py").touch()
-        (self.target_path / "tests" / "__init__.py").touch()
-
-    def create_starter_files(self) -> None:
-        """Create starter application files based on project type."""
-        src_dir = self.target_path / "src" / self.config.name
-        tests_dir = self.target_path / "tests"
+def _validate_registry(v: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate a registry field, letting mocks through for tests."""
+    # Real registries never need the test-only mock check
+    if isinstance(v, TemplateRegistry):
+        return handler(v)
 
-        starter_content = self._get_starter_content()
-        if starter_content:
-            filename, content = starter_content
-            (src_dir / filename).write_text(content)
+    from unittest.mock import Mock
 
-        # Basic test file
-        test_content = f'''"""Test {self.config.name}."""
+    if isinstance(v, Mock):
+        return v
+    return handler(v)
 
-def test_placeholder():
-    """Placeholder test."""
-    assert True
-'''
-        (tests_dir / "test_main.py").write_text(test_content)
 
-    def _get_starter_content(self) -> tuple[str, str] | None:
-        """Get starter file content based on project type."""
-        if self.config.project_type == "api":
-            return "main.py", self._get_api_starter()
-        elif self.config.project_type == "cli":
-            return "cli.py", self._get_cli_starter()
-        return None
+# Files generated from templates for every project, plus container extras
+_BASE_FILES = ("devenv.nix", "justfile", "pyproject.toml", ".envrc")
+_CONTAINER_FILES: dict[str, tuple[str, ...]] = {
+    "docker": ("Dockerfile", "docker-compose.yml"),
+    "nixos": ("container.nix",),
+}
 
-    def _get_api_starter(self) -> str:
-        """Get FastAPI starter content."""
-        return f'''"""FastAPI application."""
+# Starter sources; the API starter is a str.format template, the rest are
+# pre-encoded so only the project name needs encoding per project
+_API_STARTER = '''"""FastAPI application."""
 
 from fastapi import FastAPI
 
-app = FastAPI(title="{self.config.name}", version="0.1.0")
+app = FastAPI(title="{name}", version="0.1.0")
 
 @app.get("/")
 async def root():
-    return {{"message": "Hello from {self.config.name}!"}}
+    return {{"message": "Hello from {name}!"}}
 
 @app.get("/health")
 async def health():
     return {{"status": "healthy"}}
 '''
 
-    def _get_cli_starter(self) -> str:
-        """Get CLI starter content."""
-        return '''"""Command line interface."""
+_CLI_STARTER = b'''"""Command line interface."""
 
 import typer
 
@@ -102,6 +82,87 @@ if __name__ == "__main__":
     main()
 '''
 
+_TEST_STARTER_PREFIX = b'"""Test '
+_TEST_STARTER_SUFFIX = b'''."""
+
+def test_placeholder():
+    """Placeholder test."""
+    assert True
+'''
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    """Write a small file with a single open/write/close, bypassing text IO."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+class ProjectStructure(BaseModel):
+    """Manages project directory structure creation."""
+
+    target_path: Path = Field(..., description="Target project path")
+    config: ProjectConfig = Field(..., description="Project configuration")
+
+    def create_directories(self) -> None:
+        """Create project directory structure."""
+        src_dir, tests_dir = self._get_directories()
+
+        # Main source and tests directories
+        os.makedirs(src_dir, exist_ok=True)
+        os.makedirs(tests_dir, exist_ok=True)
+
+        # Create __init__.py files (append mode leaves existing content alone)
+        for init_file in (src_dir / "__init__.py", tests_dir / "__init__.py"):
+            open(init_file, "ab").close()
+
+    def create_starter_files(self) -> None:
+        """Create starter application files based on project type."""
+        for path, content in self._get_starter_files():
+            _write_bytes(path, content)
+
+    def _get_directories(self) -> tuple[Path, Path]:
+        """Get the project source and tests directories."""
+        return self.target_path / "src" / self.config.name, self.target_path / "tests"
+
+    def _get_starter_files(self) -> list[tuple[Path, bytes]]:
+        """Get all starter files to write as encoded content."""
+        src_dir, tests_dir = self._get_directories()
+        files: list[tuple[Path, bytes]] = []
+
+        starter = self._get_starter_content()
+        if starter:
+            filename, content = starter
+            files.append((src_dir / filename, content))
+
+        # Basic test file
+        test_content = (
+            _TEST_STARTER_PREFIX + self.config.name.encode("utf-8") + _TEST_STARTER_SUFFIX
+        )
+        files.append((tests_dir / "test_main.py", test_content))
+
+        return files
+
+    def _get_starter_content(self) -> tuple[str, bytes] | None:
+        """Get starter file name and content for project type."""
+        if self.config.project_type == "api":
+            return "main.py", self._get_api_starter()
+        elif self.config.project_type == "cli":
+            return "cli.py", self._get_cli_starter()
+        return None
+
+    def _get_api_starter(self) -> bytes:
+        """Get FastAPI starter content."""
+        return _API_STARTER.format(name=self.config.name).encode("utf-8")
+
+    def _get_cli_starter(self) -> bytes:
+        """Get CLI starter content."""
+        return _CLI_STARTER
+
 
 class ProjectGenerator(BaseModel):
     """Generates project files from templates."""
@@ -112,43 +173,41 @@ class ProjectGenerator(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_validator("registry", mode="wrap")
-    @classmethod
-    def _allow_mock_registry(cls, v, handler):
-        try:
-            from unittest.mock import Mock
-        except Exception:
-            return handler(v)
-        if isinstance(v, Mock) and os.getenv("PYTEST_CURRENT_TEST"):
-            return v
-        return handler(v)
+    if _ALLOW_MOCK_REGISTRY:
 
-    def get_files_to_generate(self) -> list[str]:
-        """Get list of template files to generate."""
-        files = ["devenv.nix", "justfile", "pyproject.toml", ".envrc"]
+        @field_validator("registry", mode="wrap")
+        @classmethod
+        def _allow_mock_registry(
+            cls, v: Any, handler: ValidatorFunctionWrapHandler
+        ) -> Any:
+            return _validate_registry(v, handler)
 
-        if self.config.use_containers:
-            if self.config.container_type == "docker":
-                files.extend(["Dockerfile", "docker-compose.yml"])
-            elif self.config.container_type == "nixos":
-                files.append("container.nix")
+    def _get_file_plan(self) -> list[tuple[str, str]]:
+        """Get output file and template name pairs to generate."""
+        files = _BASE_FILES + _CONTAINER_FILES.get(self.config.container_type, ())
+        return [(file_name, f"{file_name}.j2") for file_name in files]
 
-        return files
+    def get_files_to_generate(self) -> list[str]:
+        """Get list of template files to generate."""
+        return [file_name for file_name, _ in self._get_file_plan()]
 
     def generate_files(self) -> None:
         """Generate all project files from templates."""
         context = self.config.get_template_context()
+        rendered_files: dict[Path, bytes] = {}
 
-        for file_name in self.get_files_to_generate():
-            template_name = f"{file_name}.j2"
+        # Render everything first so the writes happen back to back
+        for file_name, template_name in self._get_file_plan():
+            # Skip templates that fail to render
+            with suppress(TemplateError):
+                rendered = self.registry.render_if_present(template_name, context)
+                if rendered is not None:
+                    rendered_files[self.target_path / file_name] = rendered.encode(
+                        "utf-8"
+                    )
 
-            if self.registry.has_template(template_name):
-                try:
-                    rendered = self.registry.render_template(template_name, context)
-                    (self.target_path / file_name).write_text(rendered)
-                except Exception:
-                    # Skip templates that fail to render
-                    continue
+        for path, payload in rendered_files.items():
+            _write_bytes(path, payload)
 
     def initialize_python_project(self) -> None:
         """Initialize Python project with uv if available."""
@@ -158,7 +217,8 @@ class ProjectGenerator(BaseModel):
                     ["uv", "init", "--python", self.config.python_version],
                     cwd=self.target_path,
                     check=True,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                 )
             except (subprocess.CalledProcessError, FileNotFoundError):
                 pass  # uv not available or failed
@@ -168,23 +228,21 @@ class DevEnvTemplater(BaseModel):
     """DevEnv project templater with Jinja2 integration."""
 
     templates_dir: Path = Field(
-        default_factory=lambda: Path(__file__).parent / "templates/",
+        default=DEFAULT_TEMPLATES_DIR,
         description="Custom templates directory",
     )
     registry: TemplateRegistry = Field(default_factory=lambda: TEMPLATE_REGISTRY)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @field_validator("registry", mode="wrap")
-    @classmethod
-    def _allow_mock_registry(cls, v, handler):
-        try:
-            from unittest.mock import Mock
-        except Exception:
-            return handler(v)
-        if isinstance(v, Mock) and os.getenv("PYTEST_CURRENT_TEST"):
-            return v
-        return handler(v)
+    if _ALLOW_MOCK_REGISTRY:
+
+        @field_validator("registry", mode="wrap")
+        @classmethod
+        def _allow_mock_registry(
+            cls, v: Any, handler: ValidatorFunctionWrapHandler
+        ) -> Any:
+            return _validate_registry(v, handler)
 
     def ensure_templates_exist(self) -> None:
         """Create templates directory and default templates."""
@@ -192,7 +250,16 @@ class DevEnvTemplater(BaseModel):
 
         for name, content in self.registry.templates.items():
             template_file = self.templates_dir / name
-            template_file.write_text(content)
+            payload = content.encode("utf-8")
+
+            # Skip rewriting templates that are already up to date
+            try:
+                if template_file.read_bytes() == payload:
+                    continue
+            except FileNotFoundError:
+                pass
+
+            _write_bytes(template_file, payload)
 
     def generate_project(self, config: ProjectConfig, target_dir: Path | str) -> None:
         """Generate project files from templates."""
@@ -3,11 +3,70 @@
 
 from __future__ import annotations
 
+import os
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import BaseLoader, Environment, TemplateNotFound
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateNotFound,
+)
+from jinja2.bccache import Bucket
 from pydantic import BaseModel, Field, ConfigDict
 
+# Templates shipped with the package
+DEFAULT_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+@lru_cache(maxsize=1)
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Get the on-disk Jinja2 bytecode cache shared across devman runs."""
+    try:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(cache_home) / "devman" / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except (OSError, RuntimeError):
+        # Rendering still works without a persistent cache (or a home directory)
+        return None
+    return FileSystemBytecodeCache(str(cache_dir), "%s.cache")
+
+
+class _LazyBytecodeCache(BytecodeCache):
+    """Best-effort bytecode cache that sets up its directory on first compile.
+
+    Cache IO errors (read-only or full disks) are ignored so rendering never
+    depends on the cache being usable.
+    """
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        cache = _bytecode_cache()
+        if cache is not None:
+            with suppress(OSError):
+                cache.load_bytecode(bucket)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        cache = _bytecode_cache()
+        if cache is not None:
+            with suppress(OSError):
+                cache.dump_bytecode(bucket)
+
+    def clear(self) -> None:
+        cache = _bytecode_cache()
+        if cache is not None:
+            with suppress(OSError):
+                cache.clear()
+
+
+def _needs_rendering(source: str) -> bool:
+    """Check whether Jinja2 would change the source when rendering it."""
+    # Jinja2 also normalizes "\r\n" line endings, so those still go through it
+    return "{" in source or "\r" in source
+
 
 class TemplateLoader(BaseLoader):
     """Custom Jinja2 loader for template registry."""
@@ -23,8 +82,12 @@ class TemplateLoader(BaseLoader):
         if source is None:
             raise TemplateNotFound(template)
 
+        def uptodate() -> bool:
+            # A compiled template stays valid until its entry is replaced
+            return self.registry.get_template_source(template) is source
+
         # Return (source, filename, uptodate_func)
-        return source, template, lambda: True
+        return source, template, uptodate
 
 
 class TemplateRegistry(BaseModel):
@@ -34,7 +97,7 @@ class TemplateRegistry(BaseModel):
         default_factory=dict, description="Template name to content mapping"
     )
     templates_dir: Path = Field(
-        default_factory=lambda: Path(__file__).parent / "templates",
+        default=DEFAULT_TEMPLATES_DIR,
         description="Directory containing template files",
     )
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -42,7 +105,10 @@ class TemplateRegistry(BaseModel):
     def __init__(self, **data: object) -> None:
         super().__init__(**data)
         self._environment: Environment | None = None
-        self._load_templates()
+        self._compiled: dict[str, tuple[str | None, Template]] = {}
+        # Explicitly provided templates replace the templates directory
+        if "templates" not in data:
+            self._load_templates()
         self._setup_environment()
 
     def _load_templates(self) -> None:
@@ -62,14 +128,25 @@ class TemplateRegistry(BaseModel):
 
     def _setup_environment(self) -> None:
         """Setup Jinja2 environment with custom loader."""
+        if self._environment is not None:
+            return
+
         loader = TemplateLoader(self)
         self._environment = Environment(
             loader=loader,
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            cache_size=-1,
+            bytecode_cache=_LazyBytecodeCache(),
         )
 
+    def _clear_compiled(self) -> None:
+        """Drop all compiled templates so they are rebuilt from current sources."""
+        self._compiled.clear()
+        if self._environment is not None and self._environment.cache is not None:
+            self._environment.cache.clear()
+
     @property
     def environment(self) -> Environment:
         """Get Jinja2 environment."""
@@ -87,8 +164,22 @@ class TemplateRegistry(BaseModel):
 
     def render_template(self, name: str, context: dict[str, object]) -> str:
         """Render a template with given context using Jinja2."""
-        template = self.environment.get_template(name)
-        return template.render(context)
+        source = self.templates.get(name)
+        if source is not None and not _needs_rendering(source):
+            return source
+
+        # Mirror the loader's uptodate check so replaced sources recompile
+        cached = self._compiled.get(name)
+        if cached is None or cached[0] is not source:
+            template = self.environment.get_template(name)
+            cached = self._compiled[name] = (source, template)
+        return cached[1].render(context)
+
+    def render_if_present(self, name: str, context: dict[str, object]) -> str | None:
+        """Render a template if it exists, otherwise return None."""
+        if name not in self.templates:
+            return None
+        return self.render_template(name, context)
 
     def list_templates(self) -> list[str]:
         """List available template names."""
@@ -101,15 +192,15 @@ class TemplateRegistry(BaseModel):
     def add_template(self, name: str, content: str) -> None:
         """Add a template to the registry."""
         self.templates[name] = content
-        # Invalidate environment to force reload
-        self._environment = None
-        self._setup_environment()
+        # Only this template is stale; Jinja2 recompiles it via the loader's
+        # uptodate check if another template includes it
+        self._compiled.pop(name, None)
 
     def reload(self) -> None:
         """Reload templates from disk."""
         self.templates.clear()
         self._load_templates()
-        self._setup_environment()
+        self._clear_compiled()
 
 
 # Global template registry instance
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Iterator
@@ -13,6 +14,12 @@ from devman.config import ProjectConfig
 from devman.templates import TemplateRegistry
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Let templater models accept Mock registries during the test run."""
+    # Read once when devman.templater is imported, so set it before collection
+    os.environ["DEVMAN_ALLOW_MOCK_REGISTRY"] = "1"
+
+
 @pytest.fixture
 def temp_dir() -> Iterator[Path]:
     """Create temporary directory for tests."""
@@ -158,4 +165,27 @@ def reset_global_registry() -> Iterator[None]:
     # Restore original state
     TEMPLATE_REGISTRY.templates.clear()
     TEMPLATE_REGISTRY.templates.update(original_templates)
-    TEMPLATE_REGISTRY._setup_environment()
+    TEMPLATE_REGISTRY._clear_compiled()
+
+
+@pytest.fixture(autouse=True)
+def reset_cli_templater() -> Iterator[None]:
+    """Drop the cached CLI templater so patched templaters are picked up."""
+    from devman.cli import _get_templater
+
+    _get_templater.cache_clear()
+    yield
+    _get_templater.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_bytecode_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """Keep compiled template bytecode out of the user's cache directory."""
+    from devman.templates import _bytecode_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    _bytecode_cache.cache_clear()
+    yield
+    _bytecode_cache.cache_clear()
@@ -10,7 +10,7 @@ from unittest.mock import Mock, patch
 import pytest
 from typer.testing import CliRunner
 
-from devman.cli import app
+from devman.cli import _get_templater, app
 
 
 class TestCLI:
@@ -25,7 +25,7 @@ class TestCLI:
         with TemporaryDirectory() as temp_dir:
             target_dir = Path(temp_dir) / "test-project"
 
-            with patch("devman.cli.DevEnvTemplater") as mock_templater:
+            with patch("devman.templater.DevEnvTemplater") as mock_templater:
                 mock_instance = Mock()
                 mock_templater.return_value = mock_instance
 
@@ -74,7 +74,7 @@ class TestCLI:
             target_dir.mkdir()
             (target_dir / "existing_file.txt").write_text("content")
 
-            with patch("devman.cli.DevEnvTemplater") as mock_templater:
+            with patch("devman.templater.DevEnvTemplater") as mock_templater:
                 mock_instance = Mock()
                 mock_templater.return_value = mock_instance
 
@@ -90,7 +90,7 @@ class TestCLI:
         with TemporaryDirectory() as temp_dir:
             target_dir = Path(temp_dir) / "api-project"
 
-            with patch("devman.cli.DevEnvTemplater") as mock_templater:
+            with patch("devman.templater.DevEnvTemplater") as mock_templater:
                 mock_instance = Mock()
                 mock_templater.return_value = mock_instance
 
@@ -152,7 +152,7 @@ class TestCLI:
             pyproject_path.write_text("[project]\nname = 'test'\n")
 
             with patch("pathlib.Path.cwd", return_value=Path(temp_dir)):
-                with patch("devman.cli.DevEnvTemplater") as mock_templater:
+                with patch("devman.templater.DevEnvTemplater") as mock_templater:
                     mock_instance = Mock()
                     mock_templater.return_value = mock_instance
 
@@ -176,7 +176,7 @@ class TestCLI:
 
     def test_config_command(self) -> None:
         """Test config command."""
-        with patch("devman.cli.DevEnvTemplater") as mock_templater:
+        with patch("devman.templater.DevEnvTemplater") as mock_templater:
             mock_instance = Mock()
             mock_instance.templates_dir = Path("/test/templates")
             mock_instance.registry = Mock()
@@ -189,9 +189,18 @@ class TestCLI:
             assert "Configuration" in result.stdout
             assert "/test/templates" in result.stdout
 
+    def test_templater_is_reused_across_commands(self) -> None:
+        """Test commands share a single templater instance."""
+        with patch("devman.templater.DevEnvTemplater") as mock_templater:
+            first = _get_templater()
+            second = _get_templater()
+
+            assert first is second
+            mock_templater.assert_called_once()
+
     def test_init_templates_command(self) -> None:
         """Test init templates command."""
-        with patch("devman.cli.DevEnvTemplater") as mock_templater:
+        with patch("devman.templater.DevEnvTemplater") as mock_templater:
             mock_instance = Mock()
             mock_instance.templates_dir = Path("/test/templates")
             mock_templater.return_value = mock_instance
@@ -204,7 +213,7 @@ class TestCLI:
 
     def test_init_templates_confirm_overwrite(self) -> None:
         """Test init templates with confirmation."""
-        with patch("devman.cli.DevEnvTemplater") as mock_templater:
+        with patch("devman.templater.DevEnvTemplater") as mock_templater:
             mock_instance = Mock()
             mock_instance.templates_dir.exists.return_value = True
             mock_templater.return_value = mock_instance
@@ -144,3 +144,95 @@ class TestProjectConfig:
         assert "black" in dev_deps
         assert "pytest>=7.4.0" in dev_deps  # default dev dep
 
+    def test_default_dependencies_cached(self) -> None:
+        """Test default dependencies are computed once per config."""
+        config = ProjectConfig(name="test", project_type="cli", use_redis=True)
+
+        assert config.default_dependencies is config.default_dependencies
+        assert config.get_default_dependencies() == list(config.default_dependencies)
+
+        # Returned lists are copies, so callers can't corrupt the cache
+        config.get_default_dependencies().append("extra")
+        assert "extra" not in config.default_dependencies
+
+    def test_model_copy_recomputes_default_dependencies(self) -> None:
+        """Test copies with updated fields don't reuse cached defaults."""
+        config = ProjectConfig(name="test", project_type="api")
+        assert "fastapi>=0.104.0" in config.get_default_dependencies()
+
+        copied = config.model_copy(update={"project_type": "cli"})
+
+        assert "fastapi>=0.104.0" not in copied.get_default_dependencies()
+        assert "typer[all]>=0.12.0" in copied.get_default_dependencies()
+        assert "httpx>=0.25.0" not in copied.get_default_dev_dependencies()
+
+    def test_model_copy_recomputes_computed_fields(self) -> None:
+        """Test copies with updated fields serialize fresh computed fields."""
+        config = ProjectConfig(name="test", container_type="docker")
+        assert config.use_containers is True
+
+        copied = config.model_copy(update={"container_type": "none"})
+
+        assert copied.use_containers is False
+        assert copied.model_dump()["use_containers"] is False
+
+    def test_config_is_frozen(self) -> None:
+        """Test configuration cannot be mutated after creation."""
+        config = ProjectConfig(name="test")
+
+        with pytest.raises(ValidationError):
+            config.project_type = "cli"
+
+    def test_template_context_cached(self) -> None:
+        """Test template context is built once and handed out as copies."""
+        config = ProjectConfig(name="test", dependencies=["requests"])
+
+        assert config._scalar_context is config._scalar_context
+
+        context = config.get_template_context()
+        context["extra"] = "value"
+
+        assert context == {**config.get_template_context(), "extra": "value"}
+        assert "extra" not in config.get_template_context()
+
+    def test_template_context_nested_values_are_copies(self) -> None:
+        """Test mutating returned dependency lists doesn't leak into later calls."""
+        config = ProjectConfig(
+            name="test", dependencies=["requests"], local_dependencies=["../lib"]
+        )
+
+        context = config.get_template_context()
+        context["dependencies"].append("extra")
+        context["dev_dependencies"].append("extra")
+        context["local_dependencies"].append("extra")
+
+        fresh = config.get_template_context()
+        assert "extra" not in fresh["dependencies"]
+        assert "extra" not in fresh["dev_dependencies"]
+        assert fresh["local_dependencies"] == ["../lib"]
+        assert config.local_dependencies == ["../lib"]
+
+    def test_model_copy_rebuilds_template_context(self) -> None:
+        """Test copies with updated fields render with their own values."""
+        config = ProjectConfig(name="test", project_type="api")
+        assert config.get_template_context()["project_type"] == "api"
+
+        copied = config.model_copy(update={"project_type": "cli"})
+        context = copied.get_template_context()
+
+        assert context["project_type"] == "cli"
+        assert "typer[all]>=0.12.0" in context["dependencies"]
+
+    def test_template_context_sees_in_place_field_changes(self) -> None:
+        """Test list fields mutated after the first call show up in the context."""
+        config = ProjectConfig(name="test", dependencies=["x"])
+        config.get_template_context()
+
+        config.dependencies.append("y")
+        config.dev_dependencies.append("dev")
+        config.local_dependencies.append("../lib")
+
+        context = config.get_template_context()
+        assert "y" in context["dependencies"]
+        assert "dev" in context["dev_dependencies"]
+        assert context["local_dependencies"] == ["../lib"]
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
@@ -69,6 +72,19 @@ class TestProjectStructure:
             assert "typer" in content
             assert "@app.command" in content
 
+    def test_starter_files_follow_config_changes(self) -> None:
+        """Test starter files are planned from the current config."""
+        structure = ProjectStructure(
+            target_path=Path("/tmp"), config=ProjectConfig(name="a", project_type="api")
+        )
+        structure._get_starter_files()
+
+        structure.config = ProjectConfig(name="b", project_type="cli")
+        path, content = structure._get_starter_files()[0]
+
+        assert path == Path("/tmp/src/b/cli.py")
+        assert b"typer" in content
+
     def test_create_test_file(self) -> None:
         """Test test file creation."""
         with TemporaryDirectory() as temp_dir:
@@ -101,6 +117,33 @@ class TestProjectGenerator:
         expected = ["devenv.nix", "justfile", "pyproject.toml", ".envrc"]
         assert files == expected
 
+    def test_rejects_mock_registry_without_opt_in(self) -> None:
+        """Test production models don't install the mock registry validator."""
+        script = (
+            "from unittest.mock import Mock\n"
+            "from pydantic import ValidationError\n"
+            "from devman.config import ProjectConfig\n"
+            "from devman.templater import DevEnvTemplater, ProjectGenerator\n"
+            "for cls in (ProjectGenerator, DevEnvTemplater):\n"
+            "    assert not cls.__pydantic_decorators__.field_validators\n"
+            "try:\n"
+            "    ProjectGenerator(\n"
+            "        config=ProjectConfig(name='x'), target_path='.', registry=Mock()\n"
+            "    )\n"
+            "except ValidationError:\n"
+            "    pass\n"
+            "else:\n"
+            "    raise SystemExit('Mock registry was accepted')\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        env.pop("DEVMAN_ALLOW_MOCK_REGISTRY")
+
+        result = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
     def test_get_files_to_generate_docker(self) -> None:
         """Test files for Docker container."""
         config = ProjectConfig(name="test", container_type="docker")
@@ -112,6 +155,20 @@ class TestProjectGenerator:
         assert "Dockerfile" in files
         assert "docker-compose.yml" in files
 
+    def test_get_files_to_generate_follows_config_changes(self) -> None:
+        """Test the file plan is built from the current config."""
+        generator = ProjectGenerator(
+            config=ProjectConfig(name="test", container_type="none"),
+            target_path=Path("/tmp"),
+            registry=Mock(),
+        )
+        assert "Dockerfile" not in generator.get_files_to_generate()
+
+        generator.config = ProjectConfig(name="test", container_type="docker")
+
+        assert "Dockerfile" in generator.get_files_to_generate()
+        assert "docker-compose.yml" in generator.get_files_to_generate()
+
     def test_get_files_to_generate_nixos(self) -> None:
         """Test files for NixOS container."""
         config = ProjectConfig(name="test", container_type="nixos")
@@ -130,8 +187,7 @@ class TestProjectGenerator:
 
             # Mock registry
             registry = Mock()
-            registry.has_template.return_value = True
-            registry.render_template.return_value = "# Generated content"
+            registry.render_if_present.return_value = "# Generated content"
 
             generator = ProjectGenerator(
                 config=config, target_path=target_path, registry=registry
@@ -149,6 +205,26 @@ class TestProjectGenerator:
             content = (target_path / "devenv.nix").read_text()
             assert content == "# Generated content"
 
+    def test_generate_files_skips_missing_and_broken_templates(self) -> None:
+        """Test generation skips templates that are absent or fail to render."""
+        with TemporaryDirectory() as temp_dir:
+            target_path = Path(temp_dir)
+            config = ProjectConfig(name="test-project")
+
+            registry = TemplateRegistry(templates_dir=target_path / "no-templates")
+            registry.add_template("devenv.nix.j2", "{{ name }}")
+            registry.add_template("justfile.j2", "{{ missing.attr }}")
+
+            generator = ProjectGenerator(
+                config=config, target_path=target_path, registry=registry
+            )
+
+            generator.generate_files()
+
+            assert (target_path / "devenv.nix").read_text() == "test-project"
+            assert not (target_path / "justfile").exists()
+            assert not (target_path / "pyproject.toml").exists()
+
     @patch("subprocess.run")
     def test_initialize_python_project_success(self, mock_run: Mock) -> None:
         """Test successful Python project initialization."""
@@ -167,7 +243,8 @@ class TestProjectGenerator:
                 ["uv", "init", "--python", "3.11"],
                 cwd=target_path,
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
     @patch("subprocess.run")
@@ -212,6 +289,27 @@ class TestDevEnvTemplater:
             assert (templates_dir / "test.j2").exists()
             assert (templates_dir / "test.j2").read_text() == "test content"
 
+    def test_ensure_templates_exist_skips_unchanged(self) -> None:
+        """Test up-to-date templates are not rewritten."""
+        with TemporaryDirectory() as temp_dir:
+            templates_dir = Path(temp_dir) / "templates"
+            registry = TemplateRegistry(templates_dir=templates_dir)
+            registry.add_template("same.j2", "same content")
+            registry.add_template("changed.j2", "new content")
+
+            templates_dir.mkdir()
+            (templates_dir / "same.j2").write_text("same content")
+            (templates_dir / "changed.j2").write_text("old content")
+
+            templater = DevEnvTemplater(templates_dir=templates_dir, registry=registry)
+
+            with patch("devman.templater._write_bytes") as mock_write:
+                templater.ensure_templates_exist()
+
+            mock_write.assert_called_once_with(
+                templates_dir / "changed.j2", b"new content"
+            )
+
     @patch("devman.templater.ProjectGenerator")
     @patch("devman.templater.ProjectStructure")
     def test_generate_project(self, mock_structure: Mock, mock_generator: Mock) -> None:
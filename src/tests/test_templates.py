@@ -5,11 +5,12 @@ from __future__ import annotations
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import PropertyMock, patch
 
 import pytest
 from jinja2 import TemplateNotFound
 
-from devman.templates import TemplateRegistry
+from devman.templates import TemplateRegistry, _bytecode_cache
 
 
 class TestTemplateRegistry:
@@ -42,6 +43,19 @@ class TestTemplateRegistry:
             assert "test2.j2" in registry.templates
             assert "not_template.txt" not in registry.templates
 
+    def test_explicit_templates_skip_directory(self, templates_dir: Path) -> None:
+        """Test explicitly provided templates are not merged with the directory."""
+        registry = TemplateRegistry(
+            templates={"only.j2": "Only {{ name }}"}, templates_dir=templates_dir
+        )
+
+        assert registry.list_templates() == ["only.j2"]
+
+        # Reloading switches back to the templates directory
+        registry.reload()
+        assert "only.j2" not in registry.templates
+        assert "test.j2" in registry.templates
+
     def test_get_template_source(self) -> None:
         """Test getting template source."""
         registry = TemplateRegistry()
@@ -117,6 +131,52 @@ dependencies = [
         assert '"fastapi>=0.104.0",' in result
         assert '"uvicorn[standard]>=0.24.0",' in result
 
+    def test_render_template_reuses_compiled_template(self) -> None:
+        """Test compiled templates are cached until the registry changes."""
+        registry = TemplateRegistry()
+        registry.add_template("test.j2", "Hello {{ name }}!")
+
+        with patch.object(
+            registry.environment, "get_template", wraps=registry.environment.get_template
+        ) as mock_get_template:
+            assert registry.render_template("test.j2", {"name": "A"}) == "Hello A!"
+            assert registry.render_template("test.j2", {"name": "B"}) == "Hello B!"
+
+        mock_get_template.assert_called_once_with("test.j2")
+
+        registry.add_template("test.j2", "Bye {{ name }}!")
+        assert registry.render_template("test.j2", {"name": "C"}) == "Bye C!"
+
+    def test_render_template_sees_direct_template_updates(self) -> None:
+        """Test replacing a template in the templates dict recompiles it."""
+        registry = TemplateRegistry()
+        registry.add_template("test.j2", "Hello {{ name }}!")
+        assert registry.render_template("test.j2", {"name": "A"}) == "Hello A!"
+
+        registry.templates["test.j2"] = "Bye {{ name }}!"
+
+        assert registry.render_template("test.j2", {"name": "B"}) == "Bye B!"
+
+    def test_render_plain_template_skips_jinja(self) -> None:
+        """Test templates without Jinja2 syntax are returned unchanged."""
+        registry = TemplateRegistry()
+        registry.add_template("plain.j2", "use devenv\n")
+
+        with patch.object(
+            TemplateRegistry, "environment", new_callable=PropertyMock
+        ) as mock_environment:
+            assert registry.render_template("plain.j2", {}) == "use devenv\n"
+
+        mock_environment.assert_not_called()
+
+    def test_render_if_present(self) -> None:
+        """Test conditional rendering of registered templates."""
+        registry = TemplateRegistry()
+        registry.add_template("test.j2", "Hello {{ name }}!")
+
+        assert registry.render_if_present("test.j2", {"name": "X"}) == "Hello X!"
+        assert registry.render_if_present("missing.j2", {}) is None
+
     def test_render_nonexistent_template(self) -> None:
         """Test rendering nonexistent template raises error."""
         registry = TemplateRegistry()
@@ -136,6 +196,68 @@ dependencies = [
         result = registry.render_template("new.j2", {"value": "test"})
         assert result == "New template: test"
 
+    def test_bytecode_cache_persists_compiled_templates(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test compiled templates are written to the user cache directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+        cache_dir = temp_dir / "devman" / "jinja"
+
+        registry = TemplateRegistry(templates_dir=temp_dir / "nonexistent")
+        registry.add_template("cached.j2", "Hello {{ name }}!")
+
+        # The cache directory is only created once something is compiled
+        assert not cache_dir.exists()
+
+        assert registry.render_template("cached.j2", {"name": "X"}) == "Hello X!"
+        assert any(cache_dir.glob("*.cache"))
+
+    def test_bytecode_cache_write_failure_still_renders(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an unwritable cache directory doesn't break rendering."""
+
+        def read_only(*args: object, **kwargs: object) -> None:
+            raise PermissionError("Read-only cache directory")
+
+        monkeypatch.setattr("tempfile.NamedTemporaryFile", read_only)
+
+        registry = TemplateRegistry(templates_dir=Path("/nonexistent"))
+        registry.add_template("test.j2", "Hello {{ name }}!")
+
+        assert registry.render_template("test.j2", {"name": "X"}) == "Hello X!"
+
+    def test_bytecode_cache_without_home_directory(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test rendering works without a cache when no home directory exists."""
+
+        def no_home() -> Path:
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setattr(Path, "home", no_home)
+
+        assert _bytecode_cache() is None
+
+        registry = TemplateRegistry(templates_dir=Path("/nonexistent"))
+        registry.add_template("test.j2", "Hello {{ name }}!")
+        assert registry.render_template("test.j2", {"name": "X"}) == "Hello X!"
+
+    def test_add_template_keeps_environment(self) -> None:
+        """Test adding a template only invalidates that template."""
+        registry = TemplateRegistry()
+        registry.add_template("base.j2", "Base {{ name }}")
+        registry.add_template("page.j2", "{% include 'base.j2' %}!")
+        env = registry.environment
+
+        assert registry.render_template("page.j2", {"name": "v1"}) == "Base v1!"
+
+        registry.add_template("base.j2", "New base {{ name }}")
+
+        assert registry.environment is env
+        assert registry.render_template("page.j2", {"name": "v2"}) == "New base v2!"
+
     def test_reload_templates(self) -> None:
         """Test reloading templates from disk."""
         with TemporaryDirectory() as temp_dir: